@@ -4,29 +4,53 @@ This module provides functionality to connect to network devices via SSH,
 execute commands, and parse the output for network management purposes.
 """
 
+import asyncio
+import functools
+import io
 import os
+import re
 import sys
 import getpass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, TextIO, Tuple
 from pathlib import Path
 
 from dotenv import load_dotenv
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
 
+# Matches only the 'show version' lines that contain a keyword
+# parse_show_version() cares about. Letting the regex engine skip all other
+# lines avoids lowercasing and substring-testing every line in Python.
+SHOW_VERSION_LINE_RE = re.compile(
+    r"^.*(?:ap running image|cisco ap software|version|model|pid:|serial|sn:"
+    r"|uptime|compiled).*$",
+    re.IGNORECASE | re.MULTILINE,
+)
 
-def load_environment_config() -> Dict[str, str]:
-    """Load configuration from environment variables.
+# "AP Running Image" lines override any earlier software version, so they
+# must still be found after parse_show_version() stops scanning early
+AP_RUNNING_IMAGE_LINE_RE = re.compile(
+    r"^.*ap running image.*$", re.IGNORECASE | re.MULTILINE
+)
 
-    Returns:
-        Dict[str, str]: Dictionary containing SSH connection parameters.
-            Missing credentials will be set to empty strings and can be
-            prompted for at runtime.
+# Number of fields parse_show_version() fills in (excluding raw_output)
+SHOW_VERSION_FIELD_COUNT = 5
 
-    Note:
-        DEVICE_TYPE defaults to 'cisco_ios' for AP management.
-        Override in .env if needed for your specific AP model.
+# Serializes writes of buffered device output so blocks never interleave
+_STDOUT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_cached() -> Tuple[Tuple[str, str], ...]:
+    """Read .env and the environment once per process.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: Configuration as immutable (key, value)
+            pairs so the cached value cannot be modified by callers.
     """
     load_dotenv()
 
@@ -42,7 +66,82 @@ def load_environment_config() -> Dict[str, str]:
     config["SSH_ENABLE_SECRET"] = os.getenv("SSH_ENABLE_SECRET", "")
     config["SSH_TIMEOUT"] = os.getenv("SSH_TIMEOUT", "30")
 
-    return config
+    # Maximum number of devices contacted at the same time
+    config["MAX_CONCURRENCY"] = os.getenv("MAX_CONCURRENCY", "16")
+
+    # Maximum number of WLCs contacted at the same time by dudeatron_wlc.py
+    config["WLC_CONCURRENCY"] = os.getenv("WLC_CONCURRENCY", "8")
+
+    # WLC output parsers: "regex" (fast, default) or "genie"
+    config["WLC_PARSER"] = os.getenv("WLC_PARSER", "regex")
+
+    return tuple(config.items())
+
+
+def load_environment_config() -> Dict[str, str]:
+    """Load configuration from environment variables.
+
+    Returns:
+        Dict[str, str]: Dictionary containing SSH connection parameters.
+            Missing credentials will be set to empty strings and can be
+            prompted for at runtime.
+
+    Note:
+        DEVICE_TYPE defaults to 'cisco_ios' for AP management.
+        Override in .env if needed for your specific AP model.
+        The .env file is parsed only on the first call; each call returns a
+        fresh dictionary, so callers may modify it (e.g. when prompting for
+        credentials).
+    """
+    return dict(_load_env_cached())
+
+
+def get_max_concurrency(
+    config: Dict[str, str],
+    key: str = "MAX_CONCURRENCY",
+    default: str = "16"
+) -> int:
+    """Read and validate a concurrency limit setting.
+
+    Args:
+        config: Configuration dictionary loaded from the environment.
+        key: Name of the setting to read (default: MAX_CONCURRENCY).
+        default: Value used when the setting is missing.
+
+    Returns:
+        int: Maximum number of devices to process concurrently.
+
+    Raises:
+        ValueError: If the setting is not a positive integer.
+    """
+    raw_value = config.get(key, default)
+
+    try:
+        max_concurrency = int(raw_value)
+    except ValueError:
+        raise ValueError(f"{key} must be an integer, got: {raw_value}")
+
+    if max_concurrency < 1:
+        raise ValueError(f"{key} must be at least 1, got: {raw_value}")
+
+    return max_concurrency
+
+
+def use_worker_threads(max_workers: int) -> None:
+    """Size the running event loop's default executor.
+
+    asyncio.to_thread() runs on the loop's default executor, which is capped
+    at min(32, os.cpu_count() + 4) threads. Without a larger executor the
+    concurrency settings would be silently limited on small machines.
+    asyncio.run() shuts the executor down when the loop finishes.
+
+    Args:
+        max_workers: Number of worker threads to allow at once.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dudeatron")
+    )
 
 
 def prompt_for_credentials(config: Dict[str, str]) -> None:
@@ -94,14 +193,17 @@ def read_hostnames_from_file(file_path: str) -> List[str]:
     if not path.exists():
         raise FileNotFoundError(f"Hostnames file not found: {file_path}")
 
-    hostnames = []
+    # Read the whole file at once; hostname lists are small
+    stripped_lines = (
+        line.strip() for line in path.read_text(encoding="utf-8").splitlines()
+    )
 
-    with open(path, "r", encoding="utf-8") as file:
-        for line in file:
-            # Strip whitespace and skip empty lines and comments
-            stripped_line = line.strip()
-            if stripped_line and not stripped_line.startswith("#"):
-                hostnames.append(stripped_line)
+    # Skip empty lines and comments
+    hostnames = [
+        stripped_line
+        for stripped_line in stripped_lines
+        if stripped_line and not stripped_line.startswith("#")
+    ]
 
     if not hostnames:
         raise ValueError(f"No valid hostnames found in file: {file_path}")
@@ -109,6 +211,29 @@ def read_hostnames_from_file(file_path: str) -> List[str]:
     return hostnames
 
 
+@contextmanager
+def buffered_device_output() -> Iterator[io.StringIO]:
+    """Collect one device's console output and write it to stdout as a block.
+
+    Yields:
+        io.StringIO: Buffer to pass as the stream argument of per-device
+            functions (e.g. print(..., file=stream)).
+
+    Note:
+        Devices are processed concurrently, so printing directly would mix
+        lines from different devices. Buffering also replaces many small
+        stdout writes with a single write per device.
+    """
+    buffer = io.StringIO()
+    try:
+        yield buffer
+    finally:
+        with _STDOUT_LOCK:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+
+@functools.lru_cache(maxsize=1)
 def setup_logs_directory() -> Path:
     """Create logs directory if it doesn't exist.
 
@@ -119,16 +244,48 @@ def setup_logs_directory() -> Path:
         The logs directory is created in the same location as the script.
         This directory should be added to .gitignore to avoid committing
         sensitive session logs to version control.
+
+        The result is cached, so the directory is created on the first call
+        and later device sessions reuse the same Path without another mkdir.
     """
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     return logs_dir
 
 
-def connect_and_execute_command(
+def _execute_command(
+    device_params: Dict[str, Any],
+    command: str,
+    stream: Optional[TextIO] = None
+) -> str:
+    """Open an SSH session, run a single command, and disconnect.
+
+    Args:
+        device_params: Netmiko connection parameters for the device.
+        command: The command to execute on the device.
+        stream: Where to write progress messages (default: sys.stdout).
+
+    Returns:
+        str: Raw command output.
+
+    Note:
+        This function blocks on network I/O. It is run in a worker thread via
+        asyncio.to_thread() so that several devices can be contacted at once.
+    """
+    with ConnectHandler(**device_params) as connection:
+        # Enter enable mode if secret is provided
+        if device_params["secret"]:
+            connection.enable()
+
+        print(f"Executing command: {command}", file=stream)
+        return connection.send_command(command)
+
+
+async def connect_and_execute_command(
     hostname: str,
     command: str,
-    config: Dict[str, str]
+    config: Dict[str, str],
+    stream: Optional[TextIO] = None
 ) -> Optional[str]:
     """Connect to a network device and execute a command.
 
@@ -136,6 +293,7 @@ def connect_and_execute_command(
         hostname: The hostname or IP address of the device.
         command: The command to execute on the device.
         config: Dictionary containing SSH connection parameters.
+        stream: Where to write progress messages (default: sys.stdout).
 
     Returns:
         Optional[str]: Command output if successful, None if connection failed.
@@ -164,29 +322,26 @@ def connect_and_execute_command(
     }
 
     try:
-        print(f"Connecting to {hostname}...")
-        connection = ConnectHandler(**device_params)
+        print(f"Connecting to {hostname}...", file=stream)
 
-        # Enter enable mode if secret is provided
-        if device_params["secret"]:
-            connection.enable()
-
-        print(f"Executing command: {command}")
-        output = connection.send_command(command)
+        # Netmiko is blocking, so run the session in a worker thread to keep
+        # the event loop free to service other devices
+        output = await asyncio.to_thread(
+            _execute_command, device_params, command, stream
+        )
 
-        connection.disconnect()
-        print(f"Successfully retrieved data from {hostname}\n")
+        print(f"Successfully retrieved data from {hostname}\n", file=stream)
 
         return output
 
     except NetmikoTimeoutException:
-        print(f"ERROR: Connection timeout to {hostname}")
+        print(f"ERROR: Connection timeout to {hostname}", file=stream)
         return None
     except NetmikoAuthenticationException:
-        print(f"ERROR: Authentication failed for {hostname}")
+        print(f"ERROR: Authentication failed for {hostname}", file=stream)
         return None
     except Exception as error:
-        print(f"ERROR: Failed to connect to {hostname}: {str(error)}")
+        print(f"ERROR: Failed to connect to {hostname}: {str(error)}", file=stream)
         return None
 
 
@@ -218,10 +373,14 @@ def parse_show_version(output: str) -> Dict[str, Any]:
         "raw_output": output
     }
 
-    lines = output.split("\n")
+    # Fields that have gone from None to a value; once all are set the rest
+    # of the output only matters for "AP Running Image" lines
+    filled_count = 0
 
-    for line in lines:
+    for line_match in SHOW_VERSION_LINE_RE.finditer(output):
+        line = line_match.group(0)
         line_lower = line.lower()
+        is_version_missing = parsed_data["software_version"] is None
 
         # Extract software version (common patterns)
         # Prioritize "AP Running Image" pattern for version number (most specific)
@@ -236,66 +395,146 @@ def parse_show_version(output: str) -> Dict[str, Any]:
             if "cisco ios" in line_lower or "ios xe" in line_lower:
                 parsed_data["software_version"] = line.strip()
 
+        if is_version_missing and parsed_data["software_version"] is not None:
+            filled_count += 1
+
         # Extract model information
         if "model" in line_lower or "pid:" in line_lower:
             if parsed_data["model"] is None:
                 parsed_data["model"] = line.strip()
+                filled_count += 1
 
         # Extract serial number
         if "serial" in line_lower or "sn:" in line_lower:
             if parsed_data["serial_number"] is None:
                 parsed_data["serial_number"] = line.strip()
+                filled_count += 1
 
         # Extract uptime
         if "uptime" in line_lower:
             if parsed_data["uptime"] is None:
                 parsed_data["uptime"] = line.strip()
+                filled_count += 1
 
         # Extract build time
         if "compiled" in line_lower:
             if parsed_data["build_time"] is None:
                 parsed_data["build_time"] = line.strip()
+                filled_count += 1
+
+        if filled_count == SHOW_VERSION_FIELD_COUNT:
+            # Only a later "AP Running Image" line can still change the result
+            for image_match in AP_RUNNING_IMAGE_LINE_RE.finditer(
+                output, line_match.end()
+            ):
+                parsed_data["software_version"] = image_match.group(0).strip()
+            break
 
     return parsed_data
 
 
-def display_parsed_data(hostname: str, parsed_data: Dict[str, Any]) -> None:
+def display_parsed_data(
+    hostname: str,
+    parsed_data: Dict[str, Any],
+    stream: Optional[TextIO] = None
+) -> None:
     """Display parsed device information in a readable format.
 
     Args:
         hostname: The hostname or IP address of the device.
         parsed_data: Dictionary containing parsed device information.
+        stream: Where to write the report (default: sys.stdout).
     """
-    print(f"\n{'=' * 70}")
-    print(f"Device: {hostname}")
-    print(f"{'=' * 70}")
+    print(f"\n{'=' * 70}", file=stream)
+    print(f"Device: {hostname}", file=stream)
+    print(f"{'=' * 70}", file=stream)
 
     if parsed_data["software_version"]:
-        print(f"Software Version: {parsed_data['software_version']}")
+        print(f"Software Version: {parsed_data['software_version']}", file=stream)
     else:
-        print("Software Version: Not found")
+        print("Software Version: Not found", file=stream)
 
     if parsed_data["model"]:
-        print(f"Model: {parsed_data['model']}")
+        print(f"Model: {parsed_data['model']}", file=stream)
     else:
-        print("Model: Not found")
+        print("Model: Not found", file=stream)
 
     if parsed_data["serial_number"]:
-        print(f"Serial Number: {parsed_data['serial_number']}")
+        print(f"Serial Number: {parsed_data['serial_number']}", file=stream)
     else:
-        print("Serial Number: Not found")
+        print("Serial Number: Not found", file=stream)
 
     if parsed_data["uptime"]:
-        print(f"Uptime: {parsed_data['uptime']}")
+        print(f"Uptime: {parsed_data['uptime']}", file=stream)
     else:
-        print("Uptime: Not found")
+        print("Uptime: Not found", file=stream)
 
     if parsed_data["build_time"]:
-        print(f"Build Time: {parsed_data['build_time']}")
+        print(f"Build Time: {parsed_data['build_time']}", file=stream)
     else:
-        print("Build Time: Not found")
+        print("Build Time: Not found", file=stream)
+
+    print(f"{'=' * 70}\n", file=stream)
 
-    print(f"{'=' * 70}\n")
+
+async def process_device(
+    hostname: str,
+    config: Dict[str, str],
+    semaphore: asyncio.Semaphore
+) -> None:
+    """Run 'show version' on a single device and display the parsed result.
+
+    Args:
+        hostname: The hostname or IP address of the device.
+        config: Dictionary containing SSH connection parameters.
+        semaphore: Semaphore limiting how many devices are contacted at once.
+    """
+    with buffered_device_output() as stream:
+        async with semaphore:
+            output = await connect_and_execute_command(
+                hostname=hostname,
+                command="show version",
+                config=config,
+                stream=stream
+            )
+
+        if output:
+            parsed_data = parse_show_version(output)
+            display_parsed_data(hostname, parsed_data, stream)
+        else:
+            print(f"Skipping {hostname} due to connection failure\n", file=stream)
+
+
+async def process_devices(
+    hostnames: List[str],
+    config: Dict[str, str]
+) -> None:
+    """Process all devices concurrently, bounded by MAX_CONCURRENCY.
+
+    Args:
+        hostnames: List of hostnames/IP addresses to process.
+        config: Dictionary containing SSH connection parameters.
+
+    Note:
+        Device processing is I/O-bound (SSH handshakes and command round
+        trips), so overlapping the waits lets total run time scale with
+        the number of batches rather than the number of devices.
+    """
+    max_concurrency = get_max_concurrency(config)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Each device holds one worker thread while its SSH session runs
+    use_worker_threads(max_concurrency)
+
+    tasks = [
+        process_device(hostname, config, semaphore) for hostname in hostnames
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Report unexpected failures without aborting the remaining devices
+    for hostname, result in zip(hostnames, results):
+        if isinstance(result, Exception):
+            print(f"ERROR: Unexpected failure while processing {hostname}: {result}")
 
 
 def main() -> None:
@@ -324,19 +563,8 @@ def main() -> None:
         print(f"Found {len(hostnames)} device(s) to process")
         print()
 
-        # Process each device
-        for hostname in hostnames:
-            output = connect_and_execute_command(
-                hostname=hostname,
-                command="show version",
-                config=config
-            )
-
-            if output:
-                parsed_data = parse_show_version(output)
-                display_parsed_data(hostname, parsed_data)
-            else:
-                print(f"Skipping {hostname} due to connection failure\n")
+        # Process devices concurrently
+        asyncio.run(process_devices(hostnames, config))
 
         print("Processing complete!")
 
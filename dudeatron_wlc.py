@@ -5,17 +5,16 @@ and combines the output into a unified CSV file for analysis.
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 from dudeatron import (
     load_environment_config,
     prompt_for_credentials,
     read_hostnames_from_file,
 )
-from wlc_module import process_wlc
+from wlc_module import process_wlcs
 
 
 def main() -> None:
@@ -81,22 +80,11 @@ def main() -> None:
         print(f"Found {len(wlc_hostnames)} WLC(s) to process")
         print()
 
-        # Process each WLC
-        successful = 0
-        failed = 0
-
-        for hostname in wlc_hostnames:
-            print(f"{'=' * 70}")
-            print(f"Processing WLC: {hostname}")
-            print(f"{'=' * 70}")
-
-            csv_path = process_wlc(hostname, config)
+        # Process WLCs concurrently
+        csv_paths = asyncio.run(process_wlcs(wlc_hostnames, config))
 
-            if csv_path:
-                successful += 1
-            else:
-                failed += 1
-                print(f"Failed to process {hostname}\n")
+        successful = sum(1 for csv_path in csv_paths if csv_path)
+        failed = len(csv_paths) - successful
 
         # Summary
         print(f"{'=' * 70}")
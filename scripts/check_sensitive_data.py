@@ -12,34 +12,38 @@ Scans files for common sensitive information including:
 - High-entropy strings (potential passwords/API keys)
 """
 
-import re
 import sys
 from pathlib import Path
 from typing import List, Tuple
 
 # Import centralized patterns
-from security_patterns import APPROVED_ANON as WHITELIST_PATTERNS, SENSITIVE_PATTERNS, SKIP_FILES
-
-# Map SENSITIVE_PATTERNS to the tuple format expected by this script
-PATTERNS = {
-    name: (info["pattern"], info["description"])
-    for name, info in SENSITIVE_PATTERNS.items()
-}
+from security_patterns import (
+    APPROVED_ANON_RE,
+    BINARY_EXTENSIONS,
+    COMPILED_SENSITIVE,
+    SENSITIVE_PATTERNS_RE,
+    SKIP_FILES,
+    find_newline_offsets,
+    line_number_at,
+)
+
+
+def is_whitelisted(text: str) -> bool:
+    """Check if text matches a whitelisted pattern."""
+    return APPROVED_ANON_RE.search(text) is not None
 
 
-def is_whitelisted(text: str, pattern: str) -> bool:
-    """Check if text matches a whitelisted pattern."""
-    for whitelist_pattern in WHITELIST_PATTERNS:
-        if re.search(whitelist_pattern, text, re.IGNORECASE):
-            return True
-    return False
+def _trunc(text: str, limit: int = 60) -> str:
+    """Shorten text for display, marking truncation with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
 
 
-def check_file(filepath: str) -> Tuple[bool, List[str]]:
+def check_file(filepath: str) -> Tuple[bool, List[dict]]:
     """
     Check a file for sensitive data patterns.
 
-    Returns: (is_clean, issues)
+    Returns: (is_clean, issues), where each issue is a dict with line, type,
+    and text keys. Formatting is left to the caller.
     """
     path = Path(filepath)
 
@@ -48,7 +52,7 @@ def check_file(filepath: str) -> Tuple[bool, List[str]]:
         return True, []
 
     # Skip binary files
-    if path.suffix in {".png", ".jpg", ".jpeg", ".gif", ".pyc", ".o", ".so"}:
+    if path.suffix.lower() in BINARY_EXTENSIONS:
         return True, []
 
     try:
@@ -58,24 +62,30 @@ def check_file(filepath: str) -> Tuple[bool, List[str]]:
         return True, []  # If we can't read it, skip it
 
     issues = []
+    # Built on the first reportable match, so clean files never pay for it
+    newline_offsets = None
 
-    for pattern_name, (pattern, description) in PATTERNS.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+    # Cheap gate: one search over the fused patterns rules out most files
+    if SENSITIVE_PATTERNS_RE.search(content) is None:
+        return True, []
 
-        for match in matches:
+    # One pass per pattern, so overlapping findings from different patterns
+    # are all reported
+    for pattern_name, pattern, description in COMPILED_SENSITIVE:
+        for match in pattern.finditer(content):
             matched_text = match.group(0)
 
             # Skip whitelisted matches
-            if is_whitelisted(matched_text, pattern):
+            if is_whitelisted(matched_text):
                 continue
 
             # Calculate line number
-            line_num = content[: match.start()].count("\n") + 1
+            if newline_offsets is None:
+                newline_offsets = find_newline_offsets(content)
+            line_num = line_number_at(newline_offsets, match.start())
 
             issues.append(
-                f"  Line {line_num}: {description}\n"
-                f"    Matched: {matched_text[:60]}"
-                f"{'...' if len(matched_text) > 60 else ''}"
+                {"line": line_num, "type": description, "text": matched_text}
             )
 
     return len(issues) == 0, issues
@@ -96,7 +106,11 @@ def main():
         if not is_clean:
             all_clean = False
             all_issues.append(f"\n{filepath}:")
-            all_issues.extend(issues)
+            all_issues.extend(
+                f"  Line {issue['line']}: {issue['type']}\n"
+                f"    Matched: {_trunc(issue['text'])}"
+                for issue in issues
+            )
 
     if not all_clean:
         print("❌ Sensitive data detected:\n")
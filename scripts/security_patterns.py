@@ -9,6 +9,18 @@ This module provides shared pattern definitions for:
 All pattern changes should be made here to keep all scripts synchronized.
 """
 
+import bisect
+import re
+from typing import Any, Iterable, List, Optional
+
+# Optional dependency: Hyperscan (pip install hyperscan) provides a
+# SIMD-accelerated engine that matches many patterns in one pass. Scripts fall
+# back to Python's re module when it is not installed.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Approved anonymization patterns and false positives
 # These are safe to use in documentation and example files
 APPROVED_ANON = {
@@ -124,13 +136,14 @@ SENSITIVE_PATTERNS = {
 }
 
 # Forbidden patterns for example files
-# Example files should not contain real public IPs or MAC addresses
+# Example files should not contain real public IPs or MAC addresses. Case is
+# spelled out in the patterns themselves, so they match without re.IGNORECASE.
 FORBIDDEN_IN_EXAMPLES = {
     "public_ip": {
         "pattern": (
             r"(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
             r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
-            r"(?!(?:\.X\.Y|\.example))"
+            r"(?!(?i:\.X\.Y|\.example))"
             r"(?!\s)"
             r"(?!"
             r"(?:10\.|192\.168\.|172\.(?:1[6-9]|2[0-9]|3[01])\.)"
@@ -139,7 +152,9 @@ FORBIDDEN_IN_EXAMPLES = {
         "description": "Public IP address (examples should use RFC1918 or 192.168.X.Y)",
     },
     "real_mac": {
-        "pattern": r"(?<![xX:])(?:[0-9a-f]{2}[:\-]){5}(?:[0-9a-f]{2})(?![xXx])",
+        "pattern": (
+            r"(?<![xX:])(?:[0-9a-fA-F]{2}[:\-]){5}(?:[0-9a-fA-F]{2})(?![xX])"
+        ),
         "description": "Real MAC address (use XX:XX:XX:XX:XX:XX)",
     },
 }
@@ -151,6 +166,193 @@ SKIP_FILES = {
     "check_sensitive_data.py",
     "validate_examples.py",
     "security_scan.py",
+    "test_security_patterns.py",
     ".secrets.baseline",
     ".pre-commit-config.yaml",
 }
+
+# File extensions that are never text and are skipped without being read
+BINARY_EXTENSIONS = frozenset({
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".ico",
+    ".pdf",
+    ".pyc",
+    ".o",
+    ".so",
+    ".woff",
+    ".woff2",
+    ".zip",
+    ".gz",
+    ".tar",
+    ".whl",
+})
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """Turn a leading global flag group such as (?i) into a scoped (?i:...).
+
+    Global inline flags are only allowed at the very start of a regex, so a
+    pattern like "(?i)device-\\d+" cannot be embedded in a larger alternation
+    until its flags are scoped to the pattern itself.
+    """
+    flag_match = re.match(r"\(\?([aiLmsux]+)\)", pattern)
+    if flag_match is None:
+        return pattern
+    return f"(?{flag_match.group(1)}:{pattern[flag_match.end():]})"
+
+
+# Precompiled patterns, built once at import time
+# Scanning scripts use these instead of recompiling pattern strings for
+# every file and every match.
+
+# One precompiled pattern per sensitive check, as (name, pattern, description).
+# Findings come from a separate finditer pass per pattern: in a fused
+# alternation the leftmost match consumes its text, so an overlapping finding
+# from another pattern (a hostname inside "user=admin.corp.net") would be lost.
+COMPILED_SENSITIVE = tuple(
+    (
+        name,
+        re.compile(info["pattern"], re.IGNORECASE | re.MULTILINE),
+        info["description"],
+    )
+    for name, info in SENSITIVE_PATTERNS.items()
+)
+
+# Bytes versions of the same patterns, for matching directly over raw or
+# memory-mapped file contents without decoding them first. All patterns are
+# ASCII, so bytes matching behaves the same for ASCII text.
+COMPILED_SENSITIVE_BYTES = tuple(
+    (
+        name,
+        re.compile(info["pattern"].encode("ascii"), re.IGNORECASE | re.MULTILINE),
+        info["description"],
+    )
+    for name, info in SENSITIVE_PATTERNS.items()
+)
+
+# All sensitive patterns fused into one alternation. It is only used as a
+# "file has any candidate" gate: search() finds a match wherever any single
+# pattern would, so files it rules out need no per-pattern passes. It must
+# not be used to collect findings (see COMPILED_SENSITIVE above).
+_SENSITIVE_ALTERNATION = "|".join(
+    f"(?:{_scope_inline_flags(info['pattern'])})"
+    for info in SENSITIVE_PATTERNS.values()
+)
+SENSITIVE_PATTERNS_RE = re.compile(
+    _SENSITIVE_ALTERNATION, re.IGNORECASE | re.MULTILINE
+)
+SENSITIVE_PATTERNS_BYTES_RE = re.compile(
+    _SENSITIVE_ALTERNATION.encode("ascii"), re.IGNORECASE | re.MULTILINE
+)
+
+# All approved patterns fused into one alternation, so checking a match
+# against the whitelist is a single search instead of one per pattern.
+# Sorted only to make the compiled pattern deterministic.
+APPROVED_ANON_RE = re.compile(
+    "|".join(
+        f"(?:{_scope_inline_flags(pattern)})" for pattern in sorted(APPROVED_ANON)
+    ),
+    re.IGNORECASE,
+)
+
+
+def compile_hyperscan_prefilter(patterns: Iterable[str]) -> Optional[Any]:
+    """Compile patterns into a Hyperscan block-mode database for prefiltering.
+
+    Patterns are compiled in Hyperscan's prefilter mode, which approximates
+    constructs it cannot run natively (such as lookarounds). A prefilter hit
+    therefore means "may match" and must be confirmed with Python's re module,
+    but a miss is definitive and lets callers skip the file entirely.
+
+    Args:
+        patterns: Regex pattern strings to compile.
+
+    Returns:
+        Optional[Any]: A hyperscan.Database, or None if Hyperscan is not
+            installed or cannot compile the patterns.
+    """
+    if hyperscan is None:
+        return None
+
+    expressions = [_scope_inline_flags(pattern).encode() for pattern in patterns]
+    scan_flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_PREFILTER
+    )
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[scan_flags] * len(expressions),
+        )
+    except hyperscan.HyperscanError:
+        # Fall back to pure-Python matching rather than failing the scan
+        return None
+
+    return database
+
+
+def hyperscan_may_match(database: Any, data: Any) -> bool:
+    """Check whether any prefilter pattern may match the data.
+
+    Args:
+        database: Database returned by compile_hyperscan_prefilter().
+        data: Bytes-like object (bytes, bytearray, memoryview, or mmap).
+
+    Returns:
+        bool: True if at least one pattern may match, False otherwise.
+    """
+
+    def stop_on_first_match(pattern_id, start, end, flags, context):
+        # Returning True asks Hyperscan to stop scanning immediately
+        return True
+
+    try:
+        database.scan(data, match_event_handler=stop_on_first_match)
+    except hyperscan.ScanTerminated:
+        return True
+
+    return False
+
+
+_NEWLINE_RE = re.compile("\n")
+_NEWLINE_BYTES_RE = re.compile(b"\n")
+
+
+def find_newline_offsets(content: Any) -> List[int]:
+    """Find the offset of every newline in the content.
+
+    Building this once per file lets line_number_at() look up line numbers
+    with a binary search instead of recounting newlines in the prefix before
+    every match.
+
+    Args:
+        content: File contents as str, bytes, or mmap.
+
+    Returns:
+        List[int]: Sorted newline offsets.
+    """
+    newline_re = _NEWLINE_RE if isinstance(content, str) else _NEWLINE_BYTES_RE
+    return [newline_match.start() for newline_match in newline_re.finditer(content)]
+
+
+def line_number_at(newline_offsets: List[int], offset: int) -> int:
+    """Convert a character/byte offset into a 1-based line number.
+
+    Args:
+        newline_offsets: Result of find_newline_offsets() for the content.
+        offset: Offset into the same content (e.g. match.start()).
+
+    Returns:
+        int: Line number containing the offset.
+    """
+    # Number of newlines strictly before the offset, plus one
+    return bisect.bisect_left(newline_offsets, offset) + 1
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the security scanning scripts.
+
+Runs with pytest or directly:
+    python scripts/test_security_patterns.py
+"""
+
+import tempfile
+from pathlib import Path
+
+import check_sensitive_data
+import security_scan
+import validate_examples
+
+# A username assignment whose value is also a hostname. Each line must report
+# both patterns: one pattern's match must not hide the other's.
+OVERLAPPING_CONTENT = (
+    "USER=admin.corp-internal.net\n"
+    "user = bob.evil.org\n"
+    "nothing sensitive here\n"
+)
+
+
+def _write_temp_file(content: str) -> Path:
+    """Write content to a temporary .txt file and return its path."""
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False, encoding="utf-8"
+    ) as f:
+        f.write(content)
+    return Path(f.name)
+
+
+def test_overlapping_findings_are_all_reported():
+    """Findings that overlap another pattern's match are still reported."""
+    path = _write_temp_file(OVERLAPPING_CONTENT)
+    try:
+        _, issues = check_sensitive_data.check_file(str(path))
+        findings = security_scan.scan_file(path)["findings"]
+    finally:
+        path.unlink()
+
+    expected = {
+        (1, "admin.corp-internal.net"),
+        (2, "bob.evil.org"),
+        (2, "user = bob.evil.org"),
+    }
+    assert {(issue["line"], issue["text"]) for issue in issues} == expected
+    assert {(finding["line"], finding["text"]) for finding in findings} == expected
+
+
+def test_truncated_scan_is_reported():
+    """Files larger than MAX_SCAN_BYTES carry a warning about the unscanned tail."""
+    path = _write_temp_file("x" * (security_scan.MAX_SCAN_BYTES + 1))
+    try:
+        results = security_scan.scan_file(path)
+    finally:
+        path.unlink()
+
+    assert results["findings"] == []
+    assert len(results["warnings"]) == 1
+
+
+def test_overlapping_example_findings_are_all_reported():
+    """A MAC that starts inside a public IP is reported along with the IP."""
+    path = _write_temp_file("gateway 8.8.8.14:aa:bb:cc:dd:ee\n")
+    try:
+        is_valid, issues = validate_examples.validate_file(str(path))
+    finally:
+        path.unlink()
+
+    assert not is_valid
+    assert [issue.split("Found: ")[1] for issue in issues] == [
+        "8.8.8.14",
+        "14:aa:bb:cc:dd:ee",
+    ]
+
+
+def test_rfc1918_octets_are_decimal():
+    """Leading zeros in an octet are read as decimal, not octal."""
+    assert security_scan.is_rfc1918("192.168.01.09")
+    assert security_scan.is_rfc1918("10.0.0.08")
+    assert security_scan.is_rfc1918("172.016.0.1")
+    assert not security_scan.is_rfc1918("172.032.0.1")
+
+
+if __name__ == "__main__":
+    test_overlapping_example_findings_are_all_reported()
+    test_overlapping_findings_are_all_reported()
+    test_rfc1918_octets_are_decimal()
+    test_truncated_scan_is_reported()
+    print("✅ All security pattern checks passed")
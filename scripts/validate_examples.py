@@ -9,13 +9,24 @@ Checks that example and template files use standardized anonymization:
 - Hostnames: device-X, ap-building-Y, etc.
 """
 
+import argparse
+import codecs
+import functools
+import mmap
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
 
 # Import centralized patterns
-from security_patterns import APPROVED_ANON as APPROVED_PATTERNS, FORBIDDEN_IN_EXAMPLES
+from security_patterns import (
+    APPROVED_ANON as APPROVED_PATTERNS,
+    FORBIDDEN_IN_EXAMPLES,
+    compile_hyperscan_prefilter,
+    find_newline_offsets,
+    hyperscan_may_match,
+    line_number_at,
+)
 
 # Map FORBIDDEN_IN_EXAMPLES to the tuple format expected by this script
 FORBIDDEN_PATTERNS = {
@@ -23,60 +34,188 @@ FORBIDDEN_PATTERNS = {
     for name, info in FORBIDDEN_IN_EXAMPLES.items()
 }
 
+# Compile once at import instead of on every re.search/re.finditer call.
+# Approved patterns stay case-sensitive, as they always have been here, and are
+# compiled for bytes so forbidden matches can be checked without decoding.
+APPROVED_COMPILED = [re.compile(pattern.encode()) for pattern in APPROVED_PATTERNS]
 
-def is_approved_anonymization(text: str) -> bool:
-    """Check if text is approved anonymized format."""
-    for pattern in APPROVED_PATTERNS:
-        if re.search(pattern, text):
+
+# One bytes pattern per forbidden check, as (pattern, description), so they can
+# run directly over a memory-mapped file without decoding it first. Each check
+# gets its own finditer pass: in a single fused alternation the leftmost match
+# consumes its text and hides overlapping findings from the other patterns.
+# No re.IGNORECASE: the patterns spell out both cases where they need them.
+FORBIDDEN_COMPILED = [
+    (re.compile(pattern.encode()), description)
+    for pattern, description in FORBIDDEN_PATTERNS.values()
+]
+
+# All forbidden patterns fused into one regex, used only as a "file has any
+# candidate" gate before the per-pattern passes
+COMBINED = re.compile(
+    "|".join(f"(?:{pattern})" for pattern, _ in FORBIDDEN_PATTERNS.values()).encode()
+)
+
+# Bytes of the file decoded per step when checking that it is valid UTF-8
+UTF8_CHECK_CHUNK_SIZE = 1024 * 1024
+
+# Hyperscan prefilter for the forbidden patterns; set by init_hyperscan() when
+# --engine hyperscan is requested and Hyperscan is available
+HYPERSCAN_DATABASE: Optional[Any] = None
+
+
+def init_hyperscan() -> bool:
+    """Compile the forbidden patterns into a Hyperscan prefilter database.
+
+    Returns:
+        bool: True if the Hyperscan engine is active, False if Hyperscan is not
+        installed or cannot compile the patterns.
+    """
+    global HYPERSCAN_DATABASE
+    HYPERSCAN_DATABASE = compile_hyperscan_prefilter(
+        pattern for pattern, _ in FORBIDDEN_PATTERNS.values()
+    )
+    return HYPERSCAN_DATABASE is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def is_approved_anonymization(text: bytes) -> bool:
+    """Check if text is approved anonymized format.
+
+    Example files repeat the same placeholder values many times, so results
+    are cached per matched text. The approved patterns are compiled once at
+    import, which keeps the cache valid for the life of the process.
+    """
+    for pattern in APPROVED_COMPILED:
+        if pattern.search(text):
             return True
     return False
 
 
-def validate_file(filepath: str) -> Tuple[bool, List[str]]:
-    """
-    Validate an example file uses proper anonymization.
+def check_utf8(content: Any) -> None:
+    """Validate that the content is UTF-8 without decoding it all at once.
 
-    Returns: (is_valid, issues)
+    Args:
+        content: Bytes-like file contents (bytes or mmap).
+
+    Raises:
+        UnicodeDecodeError: If the content is not valid UTF-8.
     """
-    path = Path(filepath)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for offset in range(0, len(content), UTF8_CHECK_CHUNK_SIZE):
+        decoder.decode(content[offset:offset + UTF8_CHECK_CHUNK_SIZE])
+    decoder.decode(b"", final=True)
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except Exception as e:
-        return False, [f"Could not read file: {e}"]
 
+def find_forbidden(content: Any) -> List[str]:
+    """Find forbidden, non-anonymized data in raw file contents.
+
+    Args:
+        content: Bytes-like file contents (bytes or mmap).
+
+    Returns:
+        List[str]: Formatted issues, one per forbidden match.
+    """
     issues = []
 
-    for pattern_name, (pattern, description) in FORBIDDEN_PATTERNS.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+    # A Hyperscan miss is definitive, so most files skip the re pass entirely;
+    # a hit only means "may match" and is confirmed below
+    if HYPERSCAN_DATABASE is not None and not hyperscan_may_match(
+        HYPERSCAN_DATABASE, content
+    ):
+        return issues
+
+    # Built on the first reportable match, so clean files never pay for it
+    newline_offsets = None
 
-        for match in matches:
-            matched_text = match.group(0)
+    # Cheap gate: one search over the fused patterns rules out most files
+    if COMBINED.search(content) is None:
+        return issues
+
+    for pattern, description in FORBIDDEN_COMPILED:
+        for match in pattern.finditer(content):
+            matched_bytes = match.group(0)
 
             # Allow if it's already in an approved format
-            if is_approved_anonymization(matched_text):
+            if is_approved_anonymization(matched_bytes):
                 continue
 
-            line_num = content[: match.start()].count("\n") + 1
+            # Only reported matches are decoded, for the message
+            matched_text = matched_bytes.decode("utf-8", "replace")
+
+            if newline_offsets is None:
+                newline_offsets = find_newline_offsets(content)
+            line_num = line_number_at(newline_offsets, match.start())
             issues.append(
                 f"  Line {line_num}: {description}\n"
                 f"    Found: {matched_text}"
             )
 
+    return issues
+
+
+def validate_file(filepath: str) -> Tuple[bool, List[str]]:
+    """
+    Validate an example file uses proper anonymization.
+
+    The file is memory-mapped and matched as bytes, so large files are paged
+    in by the OS instead of being read and decoded into one string.
+
+    Returns: (is_valid, issues)
+    """
+    path = Path(filepath)
+
+    try:
+        with open(path, "rb") as f:
+            # mmap cannot map an empty file, and there is nothing to check
+            if f.seek(0, 2) == 0:
+                return True, []
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception as e:
+        return False, [f"Could not read file: {e}"]
+
+    try:
+        check_utf8(content)
+        issues = find_forbidden(content)
+    except UnicodeDecodeError as e:
+        return False, [f"Could not read file: {e}"]
+    finally:
+        content.close()
+
     return len(issues) == 0, issues
 
 
 def main():
     """Validate all provided example files."""
-    if len(sys.argv) < 2:
-        print("Usage: validate_examples.py <file1> [file2] ...")
+    parser = argparse.ArgumentParser(
+        description="Validate that example files use anonymized data."
+    )
+    parser.add_argument("files", nargs="*", help="Example files to validate")
+    parser.add_argument(
+        "--engine",
+        choices=("re", "hyperscan"),
+        default="re",
+        help="Matching engine; hyperscan prefilters files before re (default: re)",
+    )
+    args = parser.parse_args()
+
+    if not args.files:
+        print(
+            "Usage: validate_examples.py [--engine {re,hyperscan}] "
+            "<file1> [file2] ..."
+        )
         sys.exit(0)
 
+    if args.engine == "hyperscan" and not init_hyperscan():
+        print(
+            "⚠️  Hyperscan is not available, falling back to the re engine",
+            file=sys.stderr,
+        )
+
     all_valid = True
     all_issues = []
 
-    for filepath in sys.argv[1:]:
+    for filepath in args.files:
         is_valid, issues = validate_file(filepath)
 
         if not is_valid:
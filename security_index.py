@@ -4,6 +4,11 @@ Index of security documentation and tools.
 Helps navigate all the security resources.
 """
 
+import sys
+
+# Banner separator, built once rather than on every print
+SEPARATOR = "=" * 70
+
 SECURITY_RESOURCES = {
     "Quick Start": {
         "description": "Get started in 30 seconds",
@@ -92,59 +97,65 @@ SECURITY_RESOURCES = {
 
 
 def print_index():
-    """Print the security index."""
-    print("\n" + "="*70)
-    print("🔒 DUDEATRON SECURITY - RESOURCE INDEX")
-    print("="*70 + "\n")
+    """Print the security index.
+
+    The report is assembled in a list and written with a single
+    sys.stdout.write() call instead of one print() per line.
+    """
+    out = ["\n" + SEPARATOR + "\n"]
+    out.append("🔒 DUDEATRON SECURITY - RESOURCE INDEX\n")
+    out.append(SEPARATOR + "\n\n")
     
     for section, content in SECURITY_RESOURCES.items():
-        print(f"📌 {section}")
-        print(f"   {content.get('description', '')}\n")
+        out.append(f"📌 {section}\n")
+        out.append(f"   {content.get('description', '')}\n\n")
         
         # Files
         if "files" in content:
-            print("   Files:")
+            out.append("   Files:\n")
             for file, desc in content["files"]:
-                print(f"     • {file:<40} {desc}")
-            print()
+                out.append(f"     • {file:<40} {desc}\n")
+            out.append("\n")
         
         # Scripts
         if "scripts" in content:
-            print("   Scripts:")
+            out.append("   Scripts:\n")
             for script, desc in content["scripts"]:
-                print(f"     • {script:<40} {desc}")
-            print()
+                out.append(f"     • {script:<40} {desc}\n")
+            out.append("\n")
         
         # Commands
         if "commands" in content:
-            print("   Commands:")
+            out.append("   Commands:\n")
             for cmd, desc in content["commands"]:
-                print(f"     $ {cmd:<38} {desc}")
-            print()
+                out.append(f"     $ {cmd:<38} {desc}\n")
+            out.append("\n")
         
         # Patterns
         if "patterns" in content:
             for pattern, desc in content["patterns"]:
-                print(f"     • {pattern:<40} {desc}")
-            print()
+                out.append(f"     • {pattern:<40} {desc}\n")
+            out.append("\n")
         
         # Standards
         if "standards" in content:
             for data_type, format_str, example in content["standards"]:
-                print(f"     • {data_type:<15} → {format_str:<25} ({example})")
-            print()
+                out.append(f"     • {data_type:<15} → {format_str:<25} ({example})\n")
+            out.append("\n")
         
         # Issues
         if "issues" in content:
             for issue, solution in content["issues"]:
-                print(f"     • {issue:<30} → {solution}")
-            print()
+                out.append(f"     • {issue:<30} → {solution}\n")
+            out.append("\n")
         
-        print()
+        out.append("\n")
     
-    print("="*70)
-    print("Get started: bash scripts/install-hooks.sh")
-    print("="*70 + "\n")
+    out.append(SEPARATOR + "\n")
+    out.append("Get started: bash scripts/install-hooks.sh\n")
+    out.append(SEPARATOR + "\n\n")
+
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":
@@ -9,8 +9,11 @@ with open("logs/20260106-170010-ogden-wlc4.log", "r") as f:
 
 # Extract show ap cdp neighbors output
 cdp_start = log_content.find("show ap cdp neighbors\n")
-cdp_end = log_content.find("ogden-wlc4#show ap meraki")
-cdp_output = log_content[cdp_start:cdp_end].split("\n", 2)[2]
+cdp_end = log_content.find("ogden-wlc4#show ap meraki", cdp_start)
+# Skip the command echo and the line after it without splitting the section
+first_newline = log_content.index("\n", cdp_start, cdp_end)
+second_newline = log_content.index("\n", first_newline + 1, cdp_end)
+cdp_output = log_content[second_newline + 1:cdp_end]
 
 print("First 1000 chars of raw output:")
 print(repr(cdp_output[:1000]))
@@ -32,12 +35,17 @@ print("Testing regex on actual output lines:\n")
 neighbor_info_pattern = re.compile(
     r"^(?P<ap_name>\S+)\s+(?P<ap_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<neighbor_name>\S+)\s+(?P<neighbor_port>\S+)$")
 
+# Header, count, and separator lines that are not neighbor entries
+skip_line_pattern = re.compile(r"^(?:Number|AP Name|Neighbor IP|-)")
+
 for i, line in enumerate(cdp_output.splitlines()):
     line = line.strip()
-    if line and not line.startswith('Number') and not line.startswith('AP Name') and not line.startswith('-') and not line.startswith('Neighbor IP'):
-        match = neighbor_info_pattern.match(line)
-        if match and i < 50:  # Show first few matches
-            print(f"Line {i}: MATCHED - {line[:80]}")
-            print(f"  Groups: {match.groupdict()}\n")
-        elif i < 50:
-            print(f"Line {i}: NO MATCH - {repr(line[:80])}")
+    if not line or skip_line_pattern.match(line):
+        continue
+
+    match = neighbor_info_pattern.match(line)
+    if match and i < 50:  # Show first few matches
+        print(f"Line {i}: MATCHED - {line[:80]}")
+        print(f"  Groups: {match.groupdict()}\n")
+    elif i < 50:
+        print(f"Line {i}: NO MATCH - {repr(line[:80])}")
@@ -10,16 +10,32 @@ from genie.libs.parser.iosxe.show_ap import (
 )
 
 
+def _section_body(log_content: str, start: int, end: int) -> str:
+    """Slice a section's output, skipping the command echo and the line after it.
+
+    Locating the two newlines directly avoids copying the section and splitting
+    it into a list just to drop its first two lines.
+    """
+    first_newline = log_content.index("\n", start, end)
+    second_newline = log_content.index("\n", first_newline + 1, end)
+    return log_content[second_newline + 1:end]
+
+
 def test_parser(log_file: str):
     """Parse log file and display what each parser returns."""
     with open(log_file, "r") as f:
         log_content = f.read()
+
+    # Sections appear in command order, so each search resumes from where the
+    # previous section ended and the log is scanned left to right only once
+    pos = 0
     
     # Extract show ap summary output
-    summary_start = log_content.find("show ap summary\n")
-    summary_end = log_content.find("ogden-wlc4#show ap cdp")
+    summary_start = log_content.find("show ap summary\n", pos)
+    summary_end = log_content.find("ogden-wlc4#show ap cdp", summary_start)
     if summary_start != -1 and summary_end != -1:
-        summary_output = log_content[summary_start:summary_end].split("\n", 2)[2]
+        pos = summary_end
+        summary_output = _section_body(log_content, summary_start, summary_end)
         print("=" * 80)
         print("SHOW AP SUMMARY - First AP parsed data:")
         print("=" * 80)
@@ -31,10 +47,11 @@ def test_parser(log_file: str):
             print(f"Available fields: {json.dumps(first_ap[1], indent=2)}")
     
     # Extract show ap cdp neighbors output
-    cdp_start = log_content.find("show ap cdp neighbors\n")
-    cdp_end = log_content.find("ogden-wlc4#show ap meraki")
+    cdp_start = log_content.find("show ap cdp neighbors\n", pos)
+    cdp_end = log_content.find("ogden-wlc4#show ap meraki", cdp_start)
     if cdp_start != -1 and cdp_end != -1:
-        cdp_output = log_content[cdp_start:cdp_end].split("\n", 2)[2]
+        pos = cdp_end
+        cdp_output = _section_body(log_content, cdp_start, cdp_end)
         print("\n" + "=" * 80)
         print("SHOW AP CDP NEIGHBORS - Parsed data:")
         print("=" * 80)
@@ -49,10 +66,10 @@ def test_parser(log_file: str):
             print("No CDP data parsed")
     
     # Extract show ap meraki monitoring summary output
-    meraki_start = log_content.find("show ap meraki monitoring summary\n")
+    meraki_start = log_content.find("show ap meraki monitoring summary\n", pos)
     meraki_end = log_content.find("ogden-wlc4#show clock\n", meraki_start)
     if meraki_start != -1 and meraki_end != -1:
-        meraki_output = log_content[meraki_start:meraki_end].split("\n", 2)[2]
+        meraki_output = _section_body(log_content, meraki_start, meraki_end)
         print("\n" + "=" * 80)
         print("SHOW AP MERAKI MONITORING - First AP parsed data:")
         print("=" * 80)
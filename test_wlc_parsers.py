@@ -0,0 +1,162 @@
+"""Check that the regex WLC parsers return the same records as Genie.
+
+Runs the regex parsers and their Genie counterparts over the same sample
+outputs and reports any difference, so drift between the regexes and Genie is
+caught. Genie must be installed (see requirements.txt). The Meraki case needs
+the genieparser fork's ShowApMerakiMonitoringSummary and is skipped without it.
+
+Usage:
+    python test_wlc_parsers.py
+"""
+
+import json
+import sys
+from typing import Any, Dict, List
+
+import wlc_module
+
+# Sample 'show ap summary' output with Country and Location columns. Both
+# parsers only report Registered APs, so the Downloading AP must be skipped.
+SHOW_AP_SUMMARY = """\
+Number of APs: 3
+
+AP Name                            Slots    AP Model  Ethernet MAC    Radio MAC       Location                          Country     IP Address                                 State
+-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+ap-building-A                      2        9130AXI   0000.0000.0001  0000.0000.1001  default location                  US          10.0.0.11                                  Registered
+ap-building-B                      3        9130AXI   0000.0000.0002  0000.0000.1002  Floor 2 west                      US          10.0.0.12                                  Registered
+ap-building-C                      2        4800      0000.0000.0003  0000.0000.1003  Lab                               US          10.0.0.13                                  Downloading
+"""
+
+# Sample 'show ap summary' output from releases with CC/RD columns
+SHOW_AP_SUMMARY_CC_RD = """\
+Number of APs: 2
+
+CC = Country Code
+RD = Regulatory Domain
+
+AP Name                          Slots AP Model             Ethernet MAC   Radio MAC      CC   RD   IP Address                                State        Location
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+ap-building-A                    2     C9120AXI-B           0000.0000.0001 0000.0000.1001 US   -B   10.0.0.11                                 Registered   default location
+ap-building-B                    2     C9120AXI-B           0000.0000.0002 0000.0000.1002 US   -B   10.0.0.12                                 Registered   Floor 2 west
+"""
+
+# Sample 'show ap cdp neighbors' output, including neighbor IP lists. For
+# ap-building-D the first neighbor IP line is IPv6, so the IPv4 one after it
+# must be reported.
+SHOW_AP_CDP_NEIGHBORS = """\
+Number of neighbors: 4
+
+AP Name                          AP IP                                     Neighbor Name      Neighbor Port
+-------------------------------------------------------------------------------------------------------------
+ap-building-A                    10.0.0.11                                 switch-1           GigabitEthernet1/0/1
+
+Neighbor IP Count: 1
+10.0.0.254
+ap-building-B                    10.0.0.12                                 switch-1           GigabitEthernet1/0/2
+Neighbor IP Count: 1
+10.0.0.254
+ap-building-C                    10.0.0.13                                 switch-2           TenGigabitEthernet3/0/47
+ap-building-D                    10.0.0.14                                 switch-2           TenGigabitEthernet3/0/48
+
+Neighbor IP Count: 2
+fe80::1
+10.0.0.254
+"""
+
+# Sample 'show ap meraki monitoring summary' output
+SHOW_AP_MERAKI_MONITORING = """\
+AP Name                          AP Model             Radio MAC      MAC Address    AP Serial Number  Cloud ID          Status
+----------------------------------------------------------------------------------------------------------------------------------
+ap-building-A                    C9120AXI-B           0000.0000.1001 0000.0000.0001 ABC0001           N/A               Not Registered
+ap-building-B                    C9120AXI-B           0000.0000.1002 0000.0000.0002 ABC0002           XXXX-XXXX-XXXX    Registered
+"""
+
+
+def _normalize(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Compare values as strings, since Genie returns some fields as ints."""
+    return [
+        {
+            key: (str(value) if value is not None else None)
+            for key, value in record.items()
+        }
+        for record in records
+    ]
+
+
+def compare_parsers() -> bool:
+    """Run both parser sets over the samples and print any differences.
+
+    Returns:
+        bool: True if every regex parser matches its Genie counterpart.
+
+    Raises:
+        ValueError: If Genie is not installed.
+    """
+    if wlc_module.ShowApSummary is None:
+        raise ValueError("Genie is not installed")
+
+    cases = [
+        (
+            "show ap summary",
+            SHOW_AP_SUMMARY,
+            wlc_module.parse_show_ap_summary,
+            wlc_module.parse_show_ap_summary_genie,
+        ),
+        (
+            "show ap summary (CC/RD)",
+            SHOW_AP_SUMMARY_CC_RD,
+            wlc_module.parse_show_ap_summary,
+            wlc_module.parse_show_ap_summary_genie,
+        ),
+        (
+            "show ap cdp neighbors",
+            SHOW_AP_CDP_NEIGHBORS,
+            wlc_module.parse_show_ap_cdp_neighbors,
+            wlc_module.parse_show_ap_cdp_neighbors_genie,
+        ),
+    ]
+
+    if wlc_module.ShowApMerakiMonitoringSummary is not None:
+        cases.append(
+            (
+                "show ap meraki monitoring summary",
+                SHOW_AP_MERAKI_MONITORING,
+                wlc_module.parse_show_ap_meraki_monitoring,
+                wlc_module.parse_show_ap_meraki_monitoring_genie,
+            )
+        )
+    else:
+        print(
+            "⚠️  show ap meraki monitoring summary: skipped, "
+            "ShowApMerakiMonitoringSummary (genieparser fork) is not installed"
+        )
+
+    all_match = True
+    for name, output, regex_parser, genie_parser in cases:
+        regex_records = _normalize(regex_parser(output, None))
+        genie_records = _normalize(genie_parser(output, None))
+
+        if regex_records and regex_records == genie_records:
+            print(f"✅ {name}: {len(regex_records)} records match")
+            continue
+
+        all_match = False
+        print(f"❌ {name}: regex and Genie parsers differ")
+        print(f"Regex: {json.dumps(regex_records, indent=2)}")
+        print(f"Genie: {json.dumps(genie_records, indent=2)}")
+
+    return all_match
+
+
+def test_regex_parsers_match_genie():
+    """Fail if any regex parser's records differ from Genie's."""
+    assert compare_parsers()
+
+
+if __name__ == "__main__":
+    try:
+        matched = compare_parsers()
+    except ValueError as error:
+        print(f"ERROR: {error}")
+        sys.exit(1)
+    sys.exit(0 if matched else 1)
@@ -1,39 +1,129 @@
 """WLC (Wireless LAN Controller) management module for Dudeatron.
 
 This module provides functionality to connect to WLC devices via SSH,
-execute commands, parse outputs with Genie, and combine results into CSV
-format.
+execute commands, parse outputs with precompiled regexes (or Genie), and
+combine results into CSV format.
 """
 
+import asyncio
 import csv
+import io
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
 
-from genie.libs.parser.iosxe.show_ap import (
-    ShowApCdpNeighbor,
-    ShowApMerakiMonitoringSummary,
-    ShowApSummary,
-)
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoAuthenticationException, NetmikoTimeoutException
 
+from dudeatron import (
+    buffered_device_output,
+    get_max_concurrency,
+    setup_logs_directory,
+    use_worker_threads,
+)
 
-def setup_logs_directory() -> Path:
-    """Create logs directory if it doesn't exist.
+# Genie is optional: the summary and CDP parsers have regex equivalents
+try:
+    from genie.libs.parser.iosxe.show_ap import ShowApCdpNeighbor, ShowApSummary
+except ImportError:
+    ShowApCdpNeighbor = None
+    ShowApSummary = None
+
+# The Meraki parser only exists in the project's genieparser fork
+# (-e ../genieparser), not in upstream Genie
+try:
+    from genie.libs.parser.iosxe.show_ap import ShowApMerakiMonitoringSummary
+except ImportError:
+    ShowApMerakiMonitoringSummary = None
+
+# Signature shared by all parse_show_ap_* functions
+WlcParser = Callable[[str, Optional[TextIO]], List[Dict[str, Any]]]
+
+# IPv4 address, or a loose IPv6 address (optionally with a %zone suffix)
+_IP_ADDRESS = (
+    r"(?:\d{1,3}\.){3}\d{1,3}"
+    r"|[0-9a-fA-F:]*:[0-9a-fA-F:.]*(?:%[0-9a-zA-Z]+)?"
+)
 
-    Returns:
-        Path: Path object pointing to the logs directory.
-    """
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-    return logs_dir
+# Cisco dotted MAC address, e.g. 2c57.41ff.b979
+_DOTTED_MAC = r"[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}"
+
+# (output field, Genie key) pairs copied from each Genie record
+_AP_SUMMARY_FIELD_MAP = (
+    ("slots", "slots_count"),
+    ("ap_model", "ap_model"),
+    ("mac_address", "ethernet_mac"),
+    ("radio_mac", "radio_mac"),
+    ("location", "location"),
+    ("country", "country"),
+    ("regulatory_domain", "regulatory_domain"),
+    ("ip_address", "ap_ip_address"),
+    ("state", "state"),
+)
+_CDP_NEIGHBOR_FIELD_MAP = (
+    ("neighbor_name", "neighbor_name"),
+    ("neighbor_port", "neighbor_port"),
+)
+_MERAKI_MONITORING_FIELD_MAP = (
+    ("ap_model", "ap_model"),
+    ("radio_mac", "radio_mac"),
+    ("mac_address", "mac_address"),
+    ("serial_number", "serial_number"),
+    ("cloud_id", "cloud_id"),
+    ("meraki_status", "status"),
+)
+
+# The line patterns below mirror the Genie parsers, but run over the whole
+# output in one finditer() pass. Fields are separated by [ \t]+ rather than
+# \s+ so a match can never run onto the next line.
+
+# 'show ap summary' (older releases):
+# AP Name  Slots  AP Model  Ethernet MAC  Radio MAC  Location  Country  IP Address State
+_AP_SUMMARY_RE = re.compile(
+    r"^[ \t]*(?P<ap_name>\S+)[ \t]+(?P<slots_count>\d+)[ \t]+(?P<ap_model>\S+)"
+    r"[ \t]+(?P<ethernet_mac>\S+)[ \t]+(?P<radio_mac>\S+)"
+    r"[ \t]+(?P<location>[^\r\n]*?)[ \t]+(?P<country>\S+)"
+    rf"[ \t]+(?P<ap_ip_address>{_IP_ADDRESS})[ \t]+(?P<state>Registered)",
+    re.MULTILINE,
+)
+
+# 'show ap summary' (releases with CC = Country Code, RD = Regulatory Domain):
+# AP Name  Slots  AP Model  Ethernet MAC  Radio MAC  CC  RD  IP Address  State  Location
+_AP_SUMMARY_CC_RD_RE = re.compile(
+    r"^[ \t]*(?P<ap_name>\S+)[ \t]+(?P<slots_count>\d+)[ \t]+(?P<ap_model>\S+)"
+    r"[ \t]+(?P<ethernet_mac>\S+)[ \t]+(?P<radio_mac>\S+)"
+    r"[ \t]+(?P<country>[^\r\n]*?)[ \t]+(?P<regulatory_domain>\S+)"
+    rf"[ \t]+(?P<ap_ip_address>{_IP_ADDRESS})[ \t]+(?P<state>Registered)"
+    r"[ \t]+(?P<location>\S[^\r\n]*)",
+    re.MULTILINE,
+)
+
+# 'show ap cdp neighbors' is parsed line by line, as Genie does: an AP line
+# starts a new entry, and every later line holding only an IPv4 address adds a
+# neighbor IP to it. Other lines (counts, blanks, IPv6 addresses) are skipped.
+_CDP_NEIGHBOR_LINE_RE = re.compile(
+    r"(?P<ap_name>\S+)\s+(?P<ap_ip>\d+\.\d+\.\d+\.\d+)"
+    r"\s+(?P<neighbor_name>\S+)\s+(?P<neighbor_port>\S+)"
+)
+_CDP_NEIGHBOR_IP_LINE_RE = re.compile(r"\d+\.\d+\.\d+\.\d+")
+
+# 'show ap meraki monitoring summary':
+# AP Name  AP Model  Radio MAC  MAC Address  AP Serial Number  Cloud ID  Status
+_MERAKI_MONITORING_RE = re.compile(
+    r"^[ \t]*(?P<ap_name>\S+)[ \t]+(?P<ap_model>\S+)"
+    rf"[ \t]+(?P<radio_mac>{_DOTTED_MAC})[ \t]+(?P<mac_address>{_DOTTED_MAC})"
+    r"[ \t]+(?P<serial_number>\S+)[ \t]+(?P<cloud_id>\S+)"
+    r"[ \t]+(?P<status>\S[^\r\n]*?)[ \t\r]*$",
+    re.MULTILINE,
+)
 
 
 def connect_and_execute_wlc_commands(
     hostname: str,
     commands: List[str],
-    config: Dict[str, str]
+    config: Dict[str, str],
+    stream: Optional[TextIO] = None
 ) -> Optional[Dict[str, str]]:
     """Connect to a WLC and execute multiple commands with show clock bookends.
 
@@ -41,6 +131,7 @@ def connect_and_execute_wlc_commands(
         hostname: The hostname or IP address of the WLC.
         commands: List of commands to execute on the WLC.
         config: Dictionary containing SSH connection parameters.
+        stream: Where to write progress messages (default: sys.stdout).
 
     Returns:
         Optional[Dict[str, str]]: Dictionary mapping command to output if
@@ -71,131 +162,308 @@ def connect_and_execute_wlc_commands(
     }
 
     try:
-        print(f"Connecting to WLC: {hostname}...")
-        connection = ConnectHandler(**device_params)
-
-        # For IOS-XE, also disable line wrapping to prevent output truncation
-        if config["DEVICE_TYPE"] == "cisco_xe":
-            connection.send_command("terminal width 0", expect_string=r"#")
-
-        # Enter enable mode if secret is provided
-        if device_params["secret"]:
-            connection.enable()
-
-        outputs = {}
-
-        # Execute show clock at the start
-        print(f"Executing: show clock (start)")
-        outputs["show_clock_start"] = connection.send_command("show clock")
-
-        # Execute each command
-        for command in commands:
-            print(f"Executing: {command}")
-            # Use a longer read timeout for commands with potentially large output
-            # WLCs with many APs can take a long time to return all data
-            outputs[command] = connection.send_command(
-                command,
-                read_timeout=120,
-                expect_string=r"#"
-            )
-
-        # Execute show clock at the end
-        print(f"Executing: show clock (end)")
-        outputs["show_clock_end"] = connection.send_command("show clock")
-
-        connection.disconnect()
-        print(f"Successfully retrieved data from {hostname}")
-        print(f"Session log saved to: {session_log_path}\n")
+        print(f"Connecting to WLC: {hostname}...", file=stream)
+        with ConnectHandler(**device_params) as connection:
+            # For IOS-XE, also disable line wrapping to prevent output truncation
+            if config["DEVICE_TYPE"] == "cisco_xe":
+                connection.send_command("terminal width 0", expect_string=r"#")
+
+            # Enter enable mode if secret is provided
+            if device_params["secret"]:
+                connection.enable()
+
+            outputs = {}
+
+            # Execute show clock at the start
+            print(f"Executing: show clock (start)", file=stream)
+            outputs["show_clock_start"] = connection.send_command("show clock")
+
+            # Execute each command
+            for command in commands:
+                print(f"Executing: {command}", file=stream)
+                # Use a longer read timeout for commands with potentially large output
+                # WLCs with many APs can take a long time to return all data
+                outputs[command] = connection.send_command(
+                    command,
+                    read_timeout=120,
+                    expect_string=r"#"
+                )
+
+            # Execute show clock at the end
+            print(f"Executing: show clock (end)", file=stream)
+            outputs["show_clock_end"] = connection.send_command("show clock")
+
+        print(f"Successfully retrieved data from {hostname}", file=stream)
+        print(f"Session log saved to: {session_log_path}\n", file=stream)
 
         return outputs
 
     except NetmikoTimeoutException:
-        print(f"ERROR: Connection timeout to {hostname}")
+        print(f"ERROR: Connection timeout to {hostname}", file=stream)
         return None
     except NetmikoAuthenticationException:
-        print(f"ERROR: Authentication failed for {hostname}")
+        print(f"ERROR: Authentication failed for {hostname}", file=stream)
         return None
     except Exception as error:
-        print(f"ERROR: Failed to connect to {hostname}: {str(error)}")
+        print(f"ERROR: Failed to connect to {hostname}: {str(error)}", file=stream)
         return None
 
 
-def _safe_parse(parser_cls, output: str, command_label: str) -> Dict[str, Any]:
+def _safe_parse(
+    parser_cls,
+    output: str,
+    command_label: str,
+    stream: Optional[TextIO] = None
+) -> Dict[str, Any]:
     """Run a Genie parser safely, returning an empty dict on failure."""
     try:
         parser = parser_cls(device=None)
         return parser.cli(output=output)
     except Exception as exc:  # pragma: no cover - defensive logging only
-        print(f"WARNING: Failed to parse {command_label}: {exc}")
+        print(f"WARNING: Failed to parse {command_label}: {exc}", file=stream)
         return {}
 
 
-def parse_show_ap_summary(output: str) -> List[Dict[str, Any]]:
-    """Parse 'show ap summary' using Genie."""
-    parsed = _safe_parse(ShowApSummary, output, "show ap summary")
-    ap_entries: List[Dict[str, Any]] = []
+def _first_neighbor_ip(data: Dict[str, Any]) -> str:
+    """Return the first CDP neighbor IP address, or "" if there is none."""
+    neighbor_ips = data.get("neighbor_ip_addresses")
+    return neighbor_ips[0] if neighbor_ips else ""
 
-    for ap_name, data in parsed.get("ap_name", {}).items():
-        ap_entries.append(
-            {
-                "ap_name": ap_name,
-                "slots": data.get("slots_count"),
-                "ap_model": data.get("ap_model"),
-                "mac_address": data.get("ethernet_mac"),
-                "radio_mac": data.get("radio_mac"),
-                "location": data.get("location"),
-                "country": data.get("country"),
-                "regulatory_domain": data.get("regulatory_domain"),
-                "ip_address": data.get("ap_ip_address"),
-                "state": data.get("state"),
-            }
-        )
 
-    return ap_entries
+def parse_show_ap_summary_genie(
+    output: str,
+    stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
+    """Parse 'show ap summary' using Genie."""
+    parsed = _safe_parse(ShowApSummary, output, "show ap summary", stream)
+
+    return [
+        {
+            "ap_name": ap_name,
+            **{field: data.get(key) for field, key in _AP_SUMMARY_FIELD_MAP},
+        }
+        for ap_name, data in parsed.get("ap_name", {}).items()
+    ]
 
 
-def parse_show_ap_cdp_neighbors(output: str) -> List[Dict[str, Any]]:
+def parse_show_ap_cdp_neighbors_genie(
+    output: str,
+    stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
     """Parse 'show ap cdp neighbor' using Genie."""
-    parsed = _safe_parse(ShowApCdpNeighbor, output, "show ap cdp neighbors")
-    neighbor_entries: List[Dict[str, Any]] = []
-
-    for ap_name, data in parsed.get("ap_name", {}).items():
-        neighbor_ips = data.get("neighbor_ip_addresses") or []
-        neighbor_entries.append(
-            {
-                "ap_name": ap_name,
-                "neighbor_name": data.get("neighbor_name"),
-                "neighbor_ip": neighbor_ips[0] if neighbor_ips else "",
-                "neighbor_port": data.get("neighbor_port"),
-            }
-        )
-
-    return neighbor_entries
+    parsed = _safe_parse(ShowApCdpNeighbor, output, "show ap cdp neighbors", stream)
+
+    return [
+        {
+            "ap_name": ap_name,
+            **{field: data.get(key) for field, key in _CDP_NEIGHBOR_FIELD_MAP},
+            "neighbor_ip": _first_neighbor_ip(data),
+        }
+        for ap_name, data in parsed.get("ap_name", {}).items()
+    ]
 
 
-def parse_show_ap_meraki_monitoring(output: str) -> List[Dict[str, Any]]:
+def parse_show_ap_meraki_monitoring_genie(
+    output: str,
+    stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
     """Parse 'show ap meraki monitoring summary' using Genie."""
     parsed = _safe_parse(
-        ShowApMerakiMonitoringSummary, output, "show ap meraki monitoring summary"
+        ShowApMerakiMonitoringSummary,
+        output,
+        "show ap meraki monitoring summary",
+        stream,
     )
-    monitor = parsed.get("meraki_monitoring", {})
-    aps = monitor.get("aps", {})
-    entries: List[Dict[str, Any]] = []
+    aps = parsed.get("meraki_monitoring", {}).get("aps", {})
+
+    return [
+        {
+            "ap_name": ap_name,
+            **{field: data.get(key) for field, key in _MERAKI_MONITORING_FIELD_MAP},
+        }
+        for ap_name, data in aps.items()
+    ]
+
+
+def parse_show_ap_summary(
+    output: str,
+    stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
+    """Parse 'show ap summary' with a precompiled regex.
+
+    Args:
+        output: Raw 'show ap summary' output.
+        stream: Unused; accepted for the same signature as the Genie parser.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per registered AP, with the same
+            fields as parse_show_ap_summary_genie().
+
+    Note:
+        Like Genie, the column layout is chosen by whether the output has the
+        "Country Code"/"Regulatory Domain" legend, and only APs in the
+        Registered state are returned.
+    """
+    if "Country Code" in output or "Regulatory Domain" in output:
+        pattern = _AP_SUMMARY_CC_RD_RE
+    else:
+        pattern = _AP_SUMMARY_RE
+
+    # Keyed by AP name so a repeated AP keeps its last entry, as with Genie
+    ap_entries: Dict[str, Dict[str, Any]] = {}
+
+    for match in pattern.finditer(output):
+        ap_name = match.group("ap_name")
+        ap_entries[ap_name] = {
+            "ap_name": ap_name,
+            "slots": int(match.group("slots_count")),
+            "ap_model": match.group("ap_model"),
+            "mac_address": match.group("ethernet_mac"),
+            "radio_mac": match.group("radio_mac"),
+            "location": match.group("location").strip(),
+            "country": match.group("country").strip(),
+            "regulatory_domain": match.groupdict().get("regulatory_domain"),
+            "ip_address": match.group("ap_ip_address"),
+            "state": match.group("state"),
+        }
+
+    return list(ap_entries.values())
+
+
+def parse_show_ap_cdp_neighbors(
+    output: str,
+    stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
+    """Parse 'show ap cdp neighbor' with precompiled per-line regexes.
+
+    Args:
+        output: Raw 'show ap cdp neighbors' output.
+        stream: Unused; accepted for the same signature as the Genie parser.
 
-    for ap_name, data in aps.items():
-        entries.append(
-            {
+    Returns:
+        List[Dict[str, Any]]: One entry per AP, with the same fields as
+            parse_show_ap_cdp_neighbors_genie().
+
+    Note:
+        neighbor_ip is the first IPv4-only line after the AP line, however
+        many other lines come in between. IPv4 lines before the first AP line
+        are ignored (Genie fails the whole parse on them).
+    """
+    # Keyed by AP name so a repeated AP keeps its last entry, as with Genie
+    neighbor_entries: Dict[str, Dict[str, Any]] = {}
+    current_entry: Optional[Dict[str, Any]] = None
+
+    for raw_line in output.splitlines():
+        line = raw_line.strip()
+        if line.startswith("AP Name") or line.startswith("-----"):
+            continue
+
+        match = _CDP_NEIGHBOR_LINE_RE.fullmatch(line)
+        if match is not None:
+            ap_name = match.group("ap_name")
+            current_entry = {
                 "ap_name": ap_name,
-                "ap_model": data.get("ap_model"),
-                "radio_mac": data.get("radio_mac"),
-                "mac_address": data.get("mac_address"),
-                "serial_number": data.get("serial_number"),
-                "cloud_id": data.get("cloud_id"),
-                "meraki_status": data.get("status"),
+                "neighbor_name": match.group("neighbor_name"),
+                "neighbor_ip": "",
+                "neighbor_port": match.group("neighbor_port"),
             }
+            neighbor_entries[ap_name] = current_entry
+            continue
+
+        # Only the first neighbor IP of each AP is kept
+        if (
+            current_entry is not None
+            and not current_entry["neighbor_ip"]
+            and _CDP_NEIGHBOR_IP_LINE_RE.fullmatch(line)
+        ):
+            current_entry["neighbor_ip"] = line
+
+    return list(neighbor_entries.values())
+
+
+def parse_show_ap_meraki_monitoring(
+    output: str,
+    stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
+    """Parse 'show ap meraki monitoring summary' with a precompiled regex.
+
+    This regex has not yet been checked against the fork's Genie parser, so
+    get_wlc_parsers() only uses it when that parser is not installed.
+
+    Args:
+        output: Raw 'show ap meraki monitoring summary' output.
+        stream: Unused; accepted for the same signature as the Genie parser.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per AP, with the same fields as
+            parse_show_ap_meraki_monitoring_genie().
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+
+    for match in _MERAKI_MONITORING_RE.finditer(output):
+        ap_name = match.group("ap_name")
+        entries[ap_name] = {
+            "ap_name": ap_name,
+            "ap_model": match.group("ap_model"),
+            "radio_mac": match.group("radio_mac"),
+            "mac_address": match.group("mac_address"),
+            "serial_number": match.group("serial_number"),
+            "cloud_id": match.group("cloud_id"),
+            "meraki_status": match.group("status"),
+        }
+
+    return list(entries.values())
+
+
+def get_wlc_parsers(config: Dict[str, str]) -> Tuple[WlcParser, WlcParser, WlcParser]:
+    """Select the summary, CDP, and Meraki parsers from WLC_PARSER.
+
+    Args:
+        config: Configuration dictionary loaded from the environment.
+
+    Returns:
+        Tuple[WlcParser, WlcParser, WlcParser]: Parsers for 'show ap summary',
+            'show ap cdp neighbors', and 'show ap meraki monitoring summary'.
+
+    Raises:
+        ValueError: If WLC_PARSER is unknown, or is 'genie' but Genie or its
+            Meraki parser is not installed.
+
+    Note:
+        The default 'regex' parsers are much faster than Genie. 'genie' is
+        kept as a fallback for checking their results against Genie's.
+        In 'regex' mode the Meraki command still uses the genieparser fork's
+        parser when it is installed, until the Meraki regex has been checked
+        against it.
+    """
+    parser_name = config.get("WLC_PARSER", "regex").strip().lower()
+
+    if parser_name == "regex":
+        if ShowApMerakiMonitoringSummary is not None:
+            meraki_parser = parse_show_ap_meraki_monitoring_genie
+        else:
+            meraki_parser = parse_show_ap_meraki_monitoring
+        return (
+            parse_show_ap_summary,
+            parse_show_ap_cdp_neighbors,
+            meraki_parser,
         )
 
-    return entries
+    if parser_name == "genie":
+        if ShowApSummary is None:
+            raise ValueError("WLC_PARSER is 'genie' but Genie is not installed")
+        if ShowApMerakiMonitoringSummary is None:
+            raise ValueError(
+                "WLC_PARSER is 'genie' but the genieparser fork with "
+                "ShowApMerakiMonitoringSummary is not installed"
+            )
+        return (
+            parse_show_ap_summary_genie,
+            parse_show_ap_cdp_neighbors_genie,
+            parse_show_ap_meraki_monitoring_genie,
+        )
+
+    raise ValueError(f"WLC_PARSER must be 'regex' or 'genie', got: {parser_name}")
 
 
 def combine_wlc_data_to_csv(
@@ -226,52 +494,42 @@ def combine_wlc_data_to_csv(
     # Create a master dictionary keyed by AP name
     combined_data = {}
 
+    # Every column seen so far, collected while merging instead of rescanning
+    # all rows afterwards
+    all_headers = set()
+
     # Add AP summary data
     for ap in ap_summary:
         ap_name = ap["ap_name"]
         combined_data[ap_name] = ap.copy()
+        all_headers.update(ap)
 
-    # Add CDP neighbor data
+    # Add CDP neighbor data (APs missing from the summary get a new entry)
     for neighbor in cdp_neighbors:
         ap_name = neighbor["ap_name"]
-        if ap_name in combined_data:
-            combined_data[ap_name].update({
-                "neighbor_name": neighbor.get("neighbor_name", ""),
-                "neighbor_ip": neighbor.get("neighbor_ip", ""),
-                "neighbor_port": neighbor.get("neighbor_port", ""),
-            })
-        else:
-            # AP found in CDP but not in summary
-            combined_data[ap_name] = {
-                "ap_name": ap_name,
-                "neighbor_name": neighbor.get("neighbor_name", ""),
-                "neighbor_ip": neighbor.get("neighbor_ip", ""),
-                "neighbor_port": neighbor.get("neighbor_port", ""),
-            }
+        neighbor_fields = {
+            "neighbor_name": neighbor.get("neighbor_name", ""),
+            "neighbor_ip": neighbor.get("neighbor_ip", ""),
+            "neighbor_port": neighbor.get("neighbor_port", ""),
+        }
+        combined_data.setdefault(ap_name, {"ap_name": ap_name}).update(
+            neighbor_fields
+        )
+        all_headers.update(neighbor_fields)
 
-    # Add Meraki monitoring data
+    # Add Meraki monitoring data (APs missing from both get a new entry)
     for meraki in meraki_monitoring:
         ap_name = meraki["ap_name"]
-        if ap_name in combined_data:
-            combined_data[ap_name].update({
-                "radio_mac": meraki.get("radio_mac", ""),
-                "serial_number": meraki.get("serial_number", ""),
-                "cloud_id": meraki.get("cloud_id", ""),
-                "meraki_status": meraki.get("meraki_status", ""),
-            })
-        else:
-            # AP found in Meraki but not in summary or CDP
-            combined_data[ap_name] = {
-                "ap_name": ap_name,
-                "serial_number": meraki.get("serial_number", ""),
-                "cloud_id": meraki.get("cloud_id", ""),
-                "meraki_status": meraki.get("meraki_status", ""),
-            }
-
-    # Determine all possible column headers
-    all_headers = set()
-    for ap_data in combined_data.values():
-        all_headers.update(ap_data.keys())
+        meraki_fields = {
+            "radio_mac": meraki.get("radio_mac", ""),
+            "serial_number": meraki.get("serial_number", ""),
+            "cloud_id": meraki.get("cloud_id", ""),
+            "meraki_status": meraki.get("meraki_status", ""),
+        }
+        combined_data.setdefault(ap_name, {"ap_name": ap_name}).update(
+            meraki_fields
+        )
+        all_headers.update(meraki_fields)
 
     # Sort headers for consistent output (ap_name first)
     sorted_headers = ["ap_name"] + sorted(
@@ -282,26 +540,33 @@ def combine_wlc_data_to_csv(
     csv_filename = f"{timestamp}-{hostname}.csv"
     csv_path = Path(output_dir) / csv_filename
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=sorted_headers)
-        writer.writeheader()
+    # Build rows sorted by AP name, filling in missing fields with empty strings
+    rows = [
+        [combined_data[ap_name].get(header, "") for header in sorted_headers]
+        for ap_name in sorted(combined_data)
+    ]
 
-        # Write data sorted by AP name
-        for ap_name in sorted(combined_data.keys()):
-            # Fill in missing fields with empty strings
-            row = {header: combined_data[ap_name].get(header, "")
-                   for header in sorted_headers}
-            writer.writerow(row)
+    # Build the whole CSV in memory and write it to disk in one call
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(sorted_headers)
+    writer.writerows(rows)
+    csv_path.write_bytes(buffer.getvalue().encode("utf-8"))
 
     return str(csv_path)
 
 
-def process_wlc(hostname: str, config: Dict[str, str]) -> Optional[str]:
+async def process_wlc(
+    hostname: str,
+    config: Dict[str, str],
+    stream: Optional[TextIO] = None
+) -> Optional[str]:
     """Process a single WLC: connect, execute commands, parse, and save to CSV.
 
     Args:
         hostname: The hostname or IP address of the WLC.
         config: Dictionary containing SSH connection parameters.
+        stream: Where to write progress messages (default: sys.stdout).
 
     Returns:
         Optional[str]: Path to the generated CSV file if successful,
@@ -316,31 +581,40 @@ def process_wlc(hostname: str, config: Dict[str, str]) -> Optional[str]:
     # Get timestamp for consistent naming
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
 
-    # Execute commands
-    outputs = connect_and_execute_wlc_commands(hostname, commands, config)
+    # Execute commands in a worker thread since Netmiko blocks on SSH I/O
+    outputs = await asyncio.to_thread(
+        connect_and_execute_wlc_commands, hostname, commands, config, stream
+    )
 
     if not outputs:
         return None
 
-    # Parse each command output
-    print("Parsing 'show ap summary'...")
-    ap_summary = parse_show_ap_summary(outputs.get("show ap summary", ""))
-    print(f"Found {len(ap_summary)} APs in summary")
-
-    print("Parsing 'show ap cdp neighbors'...")
-    cdp_neighbors = parse_show_ap_cdp_neighbors(
-        outputs.get("show ap cdp neighbors", "")
+    # The three parsers work on independent outputs, so run them in worker
+    # threads at the same time instead of one after another
+    print("Parsing 'show ap summary'...", file=stream)
+    print("Parsing 'show ap cdp neighbors'...", file=stream)
+    print("Parsing 'show ap meraki monitoring summary'...", file=stream)
+    summary_parser, cdp_parser, meraki_parser = get_wlc_parsers(config)
+    ap_summary, cdp_neighbors, meraki_monitoring = await asyncio.gather(
+        asyncio.to_thread(
+            summary_parser, outputs.get("show ap summary", ""), stream
+        ),
+        asyncio.to_thread(
+            cdp_parser, outputs.get("show ap cdp neighbors", ""), stream
+        ),
+        asyncio.to_thread(
+            meraki_parser,
+            outputs.get("show ap meraki monitoring summary", ""),
+            stream,
+        ),
     )
-    print(f"Found {len(cdp_neighbors)} CDP neighbor entries")
 
-    print("Parsing 'show ap meraki monitoring summary'...")
-    meraki_monitoring = parse_show_ap_meraki_monitoring(
-        outputs.get("show ap meraki monitoring summary", "")
-    )
-    print(f"Found {len(meraki_monitoring)} Meraki monitoring entries")
+    print(f"Found {len(ap_summary)} APs in summary", file=stream)
+    print(f"Found {len(cdp_neighbors)} CDP neighbor entries", file=stream)
+    print(f"Found {len(meraki_monitoring)} Meraki monitoring entries", file=stream)
 
     # Combine data and write to CSV
-    print("Combining data and writing to CSV...")
+    print("Combining data and writing to CSV...", file=stream)
     output_dir = config.get("OUTPUT_DIR", ".")
     csv_path = combine_wlc_data_to_csv(
         hostname,
@@ -351,6 +625,66 @@ def process_wlc(hostname: str, config: Dict[str, str]) -> Optional[str]:
         output_dir
     )
 
-    print(f"CSV file created: {csv_path}\n")
+    print(f"CSV file created: {csv_path}\n", file=stream)
 
     return csv_path
+
+
+async def process_wlcs(
+    hostnames: List[str],
+    config: Dict[str, str]
+) -> List[Optional[str]]:
+    """Process all WLCs concurrently, bounded by WLC_CONCURRENCY.
+
+    Args:
+        hostnames: List of WLC hostnames/IP addresses to process.
+        config: Dictionary containing SSH connection parameters.
+
+    Returns:
+        List[Optional[str]]: CSV path (or None on failure) for each WLC, in
+            the same order as hostnames.
+
+    Raises:
+        ValueError: If WLC_CONCURRENCY or WLC_PARSER is invalid.
+    """
+    # Report a bad WLC_PARSER once as a configuration error, not per WLC
+    get_wlc_parsers(config)
+
+    # WLC sessions run long commands (e.g. large AP tables), so fewer run at
+    # once than the AP default
+    wlc_concurrency = get_max_concurrency(
+        config, key="WLC_CONCURRENCY", default="8"
+    )
+    semaphore = asyncio.Semaphore(wlc_concurrency)
+
+    # Each WLC uses one worker thread for its SSH session, then up to three at
+    # once while its command outputs are parsed
+    use_worker_threads(wlc_concurrency * 3)
+
+    async def process_bounded(hostname: str) -> Optional[str]:
+        # Buffer each WLC's output so concurrent WLCs print as separate blocks
+        with buffered_device_output() as stream:
+            async with semaphore:
+                print(f"{'=' * 70}", file=stream)
+                print(f"Processing WLC: {hostname}", file=stream)
+                print(f"{'=' * 70}", file=stream)
+                csv_path = await process_wlc(hostname, config, stream)
+
+            if not csv_path:
+                print(f"Failed to process {hostname}\n", file=stream)
+
+            return csv_path
+
+    tasks = [process_bounded(hostname) for hostname in hostnames]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    csv_paths: List[Optional[str]] = []
+    for hostname, result in zip(hostnames, results):
+        # Treat unexpected exceptions as failures so other WLCs still complete
+        if isinstance(result, Exception):
+            print(f"ERROR: Unexpected failure while processing {hostname}: {result}")
+            csv_paths.append(None)
+        else:
+            csv_paths.append(result)
+
+    return csv_paths